@@ -57,6 +57,9 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 
     hass.data.setdefault(DOMAIN, {})[entry.entry_id] = coordinator
 
+    # Must be awaited: Home Assistant requires platforms to be forwarded
+    # while the entry setup lock is held and already sets them up
+    # concurrently, so a background task would only trigger warnings.
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
 
     return True
@@ -2,6 +2,8 @@
 from __future__ import annotations
 
 import logging
+from collections.abc import Mapping
+from types import MappingProxyType
 from typing import Any
 
 from homeassistant.components.climate import (
@@ -12,11 +14,16 @@ from homeassistant.components.climate import (
 )
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import ATTR_TEMPERATURE, UnitOfTemperature
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import DOMAIN, TIKO_MODE_MAP
+from .const import (
+    DOMAIN,
+    MODE_NONE,
+    PRESET_TO_TIKO_MODE,
+    TIKO_MODE_MAP,
+)
 from .coordinator import TikoUpdateCoordinator
 
 _LOGGER = logging.getLogger(__name__)
@@ -29,6 +36,9 @@ SUPPORT_FLAGS = (
 MIN_TEMP = 7.0
 MAX_TEMP = 28.0
 
+# Shared read-only default for missing room data
+_EMPTY: Mapping[str, Any] = MappingProxyType({})
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -37,12 +47,30 @@ async def async_setup_entry(
 ) -> None:
     """Set up Tiko climate devices."""
     coordinator: TikoUpdateCoordinator = hass.data[DOMAIN][entry.entry_id]
+    added_rooms: set[str] = set()
+
+    @callback
+    def _async_add_connected_rooms() -> None:
+        """Add entities for connected rooms not seen yet."""
+        # Disconnected rooms are only added once they come back online
+        new_rooms = [
+            room_id
+            for room_id, room_data in coordinator.rooms.items()
+            if room_id not in added_rooms
+            and not (room_data.get("status") or _EMPTY).get("disconnected")
+        ]
+        if not new_rooms:
+            return
+
+        added_rooms.update(new_rooms)
+        async_add_entities(
+            TikoClimate(coordinator, room_id) for room_id in new_rooms
+        )
 
-    entities = [
-        TikoClimate(coordinator, room_id)
-        for room_id, room_data in coordinator.rooms.items()
-    ]
-    async_add_entities(entities)
+    _async_add_connected_rooms()
+    entry.async_on_unload(
+        coordinator.async_add_listener(_async_add_connected_rooms)
+    )
 
 
 class TikoClimate(CoordinatorEntity[TikoUpdateCoordinator], ClimateEntity):
@@ -54,7 +82,7 @@ class TikoClimate(CoordinatorEntity[TikoUpdateCoordinator], ClimateEntity):
     _attr_max_temp = MAX_TEMP
     _attr_target_temperature_step = 0.5
     _attr_hvac_modes = [HVACMode.HEAT, HVACMode.OFF]
-    _attr_preset_modes = ["none", "eco", "away"]
+    _attr_preset_modes = list(PRESET_TO_TIKO_MODE)
     _attr_supported_features = SUPPORT_FLAGS
 
     def __init__(
@@ -67,35 +95,32 @@ class TikoClimate(CoordinatorEntity[TikoUpdateCoordinator], ClimateEntity):
         self._room_id = room_id
         self._attr_unique_id = f"{DOMAIN}_{room_id}"
         self._attr_name = coordinator.rooms[room_id]["name"]
+        self._update_attrs()
 
-    @property
-    def room_data(self) -> dict[str, Any]:
-        """Get current room data."""
-        return self.coordinator.rooms.get(self._room_id, {})
-
-    @property
-    def current_temperature(self) -> float | None:
-        """Return the current temperature."""
-        return self.room_data.get("currentTemperatureDegrees")
-
-    @property
-    def target_temperature(self) -> float | None:
-        """Return the temperature we try to reach."""
-        return self.room_data.get("targetTemperatureDegrees")
-
-    @property
-    def hvac_mode(self) -> HVACMode:
-        """Return hvac operation ie. heat, cool mode."""
-        if self.room_data.get("status", {}).get("heatingOperating"):
-            return HVACMode.HEAT
-        return HVACMode.OFF
-
-    @property
-    def hvac_action(self) -> HVACAction:
-        """Return the current running hvac operation."""
-        if self.room_data.get("status", {}).get("heatingOperating"):
-            return HVACAction.HEATING
-        return HVACAction.IDLE
+    def _update_attrs(self) -> None:
+        """Update the cached state attributes from the coordinator data."""
+        room_data = self.coordinator.rooms.get(self._room_id) or _EMPTY
+        self._attr_current_temperature = room_data.get(
+            "currentTemperatureDegrees"
+        )
+        self._attr_target_temperature = room_data.get(
+            "targetTemperatureDegrees"
+        )
+        heating = (room_data.get("status") or _EMPTY).get(
+            "heatingOperating", False
+        )
+        if heating:
+            self._attr_hvac_mode = HVACMode.HEAT
+            self._attr_hvac_action = HVACAction.HEATING
+        else:
+            self._attr_hvac_mode = HVACMode.OFF
+            self._attr_hvac_action = HVACAction.IDLE
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Handle updated data from the coordinator."""
+        self._update_attrs()
+        super()._handle_coordinator_update()
 
     @property
     def preset_mode(self) -> str | None:
@@ -120,9 +145,6 @@ class TikoClimate(CoordinatorEntity[TikoUpdateCoordinator], ClimateEntity):
 
     async def async_set_preset_mode(self, preset_mode: str) -> None:
         """Set new preset mode."""
-        if preset_mode == "eco":
-            await self.coordinator.set_mode("frost")
-        elif preset_mode == "away":
-            await self.coordinator.set_mode("absence")
-        else:  # none
-            await self.coordinator.set_mode("faux")
+        await self.coordinator.set_mode(
+            PRESET_TO_TIKO_MODE.get(preset_mode, MODE_NONE)
+        )
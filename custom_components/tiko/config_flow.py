@@ -49,8 +49,6 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             # Try to get rooms to verify credentials
             await api.authenticate()
             result = await api.get_rooms()
-            _LOGGER.debug("API test result: %s", result)
-
             if "errors" in result:
                 error_msg = result["errors"][0]["message"]
                 _LOGGER.error("API returned error: %s", error_msg)
@@ -60,7 +58,9 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                     return False, "invalid_auth"
                 return False, "cannot_connect"
 
-            if not result.get("data", {}).get("property", {}).get("rooms"):
+            rooms = result.get("data", {}).get("property", {}).get("rooms")
+            _LOGGER.debug("API test result: %d room(s)", len(rooms or ()))
+            if not rooms:
                 _LOGGER.error("No rooms found in API response")
                 return False, "no_rooms"
 
@@ -7,6 +7,7 @@ MODE_NORMAL = "on"
 MODE_OFF = "off"
 MODE_FROST = "frost"
 MODE_ABSENCE = "absence"
+MODE_NONE = "faux"
 
 # Mapping between Tiko and HA modes
 HA_MODE_MAP = {
@@ -17,3 +18,163 @@ HA_MODE_MAP = {
 }
 
 TIKO_MODE_MAP = {v: k for k, v in HA_MODE_MAP.items()}
+
+# Mapping between HA presets and Tiko modes
+PRESET_TO_TIKO_MODE = {
+    "none": MODE_NONE,
+    "eco": MODE_FROST,
+    "away": MODE_ABSENCE,
+}
+
+# GraphQL documents sent to the Tiko API
+LOGIN_MUTATION = """
+    mutation LogIn(
+        $email: String!
+        $password: String!
+        $langCode: String
+        $retainSession: Boolean
+    ) {
+        logIn(
+            input: {
+                email: $email
+                password: $password
+                langCode: $langCode
+                retainSession: $retainSession
+            }
+        ) {
+            settings {
+                client {
+                    name
+                    __typename
+                }
+                support {
+                    serviceActive
+                    phone
+                    email
+                    __typename
+                }
+                __typename
+            }
+            user {
+                id
+                clientCustomerId
+                agreements
+                properties {
+                    id
+                    allInstalled
+                    __typename
+                }
+                inbox(modes: ["app"]) {
+                    actions {
+                        label
+                        type
+                        value
+                        __typename
+                    }
+                    id
+                    lockUser
+                    maxNumberOfSkip
+                    messageBody
+                    messageHeader
+                    __typename
+                }
+                __typename
+            }
+            token
+            firstLogin
+            __typename
+        }
+    }
+"""
+
+# Selection sets shared by the property queries
+_ROOMS_SELECTION = """
+            rooms {
+                id
+                name
+                currentTemperatureDegrees
+                targetTemperatureDegrees
+                humidity
+                status {
+                    heatingOperating
+                    disconnected
+                }
+            }
+"""
+
+_DEVICES_SELECTION = """
+            devices {
+                id
+                code
+                type
+                name
+                mac
+            }
+            externalDevices {
+                id
+                name
+            }
+"""
+
+QUERY_GET_ROOMS = (
+    """
+    query GetRooms($propertyId: Int!) {
+        property(id: $propertyId) {"""
+    + _ROOMS_SELECTION
+    + """        }
+    }
+"""
+)
+
+QUERY_GET_PROPERTY = (
+    """
+    query GetProperty($propertyId: Int!) {
+        property(id: $propertyId) {"""
+    + _ROOMS_SELECTION
+    + _DEVICES_SELECTION
+    + """        }
+    }
+"""
+)
+
+MUT_SET_TEMP = """
+    mutation SET_PROPERTY_ROOM_ADJUST_TEMPERATURE(
+        $propertyId: Int!
+        $roomId: Int!
+        $temperature: Float!
+    ) {
+        setRoomAdjustTemperature(
+            input: {
+                propertyId: $propertyId
+                roomId: $roomId
+                temperature: $temperature
+            }
+        ) {
+            id
+            adjustTemperature {
+                active
+                endDateTime
+                temperature
+                __typename
+            }
+            __typename
+        }
+    }
+"""
+
+MUT_SET_MODE = """
+    mutation SetMode(
+        $propertyId: Int!
+        $mode: String!
+    ) {
+        setPropertyMode(
+            input: {
+                propertyId: $propertyId
+                mode: $mode
+            }
+        ) {
+            id
+            mode
+        }
+    }
+"""
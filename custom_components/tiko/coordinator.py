@@ -6,6 +6,8 @@ from datetime import timedelta
 import logging
 from typing import Any, Dict
 
+import aiohttp
+
 from homeassistant.core import HomeAssistant
 from homeassistant.exceptions import ConfigEntryAuthFailed
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
@@ -14,10 +16,15 @@ from homeassistant.helpers.update_coordinator import (
     UpdateFailed,
 )
 
-from .tiko_api import TikoAPI
+from .tiko_api import TikoAPI, TikoAuthenticationError, TikoRateLimitError
 
 _LOGGER = logging.getLogger(__name__)
 
+UPDATE_INTERVAL = timedelta(minutes=5)
+# Polling interval ladder used while the API reports a rate limit
+RATE_LIMIT_INTERVAL = timedelta(minutes=15)
+RATE_LIMIT_MAX_INTERVAL = timedelta(hours=1)
+
 
 class TikoUpdateCoordinator(DataUpdateCoordinator[Dict[str, Any]]):
     """Class to manage fetching Tiko data."""
@@ -39,75 +46,88 @@ class TikoUpdateCoordinator(DataUpdateCoordinator[Dict[str, Any]]):
             hass,
             _LOGGER,
             name="Tiko",
-            update_interval=timedelta(minutes=5),
+            update_interval=UPDATE_INTERVAL,
+            # Skip listener callbacks when a poll returns identical data
+            always_update=False,
         )
         session = async_get_clientsession(hass)
         self.api = TikoAPI(email, password, session)
         self.rooms: Dict[str, Dict[str, Any]] = {}
         self.devices: Dict[str, Dict[str, Any]] = {}
+        self._id_cache: Dict[int, str] = {}
+
+    def _str_id(self, item_id: int) -> str:
+        """Return the cached string key for a Tiko room or device id."""
+        if (key := self._id_cache.get(item_id)) is None:
+            key = self._id_cache[item_id] = str(item_id)
+        return key
 
     async def _async_update_data(self) -> Dict[str, Any]:
         """Fetch data from API endpoint."""
         try:
-            # Authenticate if needed
-            if not hasattr(self.api, 'token'):
-                try:
-                    await self.api.authenticate()
-                except Exception as err:
-                    _LOGGER.error("Authentication failed: %s", err)
-                    raise ConfigEntryAuthFailed from err
+            # Authenticate if needed, renewing the token before it expires
+            if self.api.token is None or not self.api.token_fresh:
+                await self.api.authenticate()
 
             try:
-                # Run these in parallel since they're independent
-                rooms_result, devices_result = await asyncio.gather(
-                    self.api.get_rooms(),
-                    self.api.get_devices(),
-                )
-            except Exception as err:
-                if "Authentication failed" not in str(err):
-                    raise
-
+                # Rooms and devices are fetched in a single GraphQL query
+                result = await self.api.get_property()
+            except TikoAuthenticationError:
                 # Token might be expired, try to re-authenticate
                 _LOGGER.debug("Token expired, re-authenticating...")
                 await self.api.authenticate()
-                rooms_result, devices_result = await asyncio.gather(
-                    self.api.get_rooms(),
-                    self.api.get_devices(),
-                )
-            # Process rooms data
-            if "data" in rooms_result and "property" in rooms_result["data"]:
-                self.rooms = {
-                    str(room["id"]): room
-                    for room in rooms_result["data"]["property"]["rooms"]
-                }
-            else:
-                _LOGGER.error("Invalid rooms response: %s", rooms_result)
-                raise UpdateFailed("Invalid rooms response")
-
-            # Process devices data
-            if (
-                "data" in devices_result
-                and "property" in devices_result["data"]
-            ):
-                self.devices = {
-                    str(device["id"]): device
-                    for device in devices_result["data"]["property"]["devices"]
-                }
-            else:
-                _LOGGER.error("Invalid devices response: %s", devices_result)
-                raise UpdateFailed("Invalid devices response")
-
-            return {
-                "rooms": self.rooms,
-                "devices": self.devices,
-            }
-
-        except ConfigEntryAuthFailed:
-            raise
-        except Exception as err:
-            _LOGGER.error("Error communicating with API: %s", err)
+                result = await self.api.get_property()
+
+        except TikoAuthenticationError as err:
+            _LOGGER.error("Authentication failed: %s", err)
+            raise ConfigEntryAuthFailed from err
+        except TikoRateLimitError as err:
+            self._back_off()
+            raise UpdateFailed(f"Rate limit reached: {err}") from err
+        except (aiohttp.ClientError, asyncio.TimeoutError) as err:
             raise UpdateFailed(f"Error communicating with API: {err}") from err
 
+        if not (property_data := (result.get("data") or {}).get("property")):
+            _LOGGER.error(
+                "Invalid property response, top-level keys: %s",
+                list(result),
+            )
+            raise UpdateFailed("Invalid property response")
+
+        # Process rooms data
+        self.rooms = {
+            self._str_id(room["id"]): room
+            for room in property_data["rooms"]
+        }
+
+        # Process devices data
+        self.devices = {
+            self._str_id(device["id"]): device
+            for device in property_data["devices"]
+        }
+
+        if self.update_interval != UPDATE_INTERVAL:
+            _LOGGER.debug("Rate limit cleared, restoring polling interval")
+            self.update_interval = UPDATE_INTERVAL
+
+        return {
+            "rooms": self.rooms,
+            "devices": self.devices,
+        }
+
+    def _back_off(self) -> None:
+        """Slow down polling after the API reported a rate limit."""
+        if self.update_interval is None or (
+            self.update_interval < RATE_LIMIT_INTERVAL
+        ):
+            interval = RATE_LIMIT_INTERVAL
+        else:
+            interval = min(self.update_interval * 2, RATE_LIMIT_MAX_INTERVAL)
+        _LOGGER.warning(
+            "Tiko API rate limit reached, polling every %s", interval
+        )
+        self.update_interval = interval
+
     async def set_temperature(self, room_id: str, temperature: float) -> None:
         """Set target temperature for a room."""
         try:
@@ -1,15 +1,49 @@
 """API client for Tiko."""
 from __future__ import annotations
 
+import json
 import logging
-import urllib.parse
+import time
+from types import MappingProxyType
 from typing import Any, Dict
 
 import aiohttp
-from gql import gql
+
+try:
+    from orjson import loads as _json_loads
+except ImportError:  # pragma: no cover - orjson ships with Home Assistant
+    from json import loads as _json_loads
+
+from .const import (
+    LOGIN_MUTATION,
+    MUT_SET_MODE,
+    MUT_SET_TEMP,
+    QUERY_GET_PROPERTY,
+    QUERY_GET_ROOMS,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
+# Age after which the token is renewed before it gets rejected by the server
+TOKEN_REFRESH_AGE = 50 * 60
+
+# Static part of each GraphQL payload, completed with variables per call
+_GET_ROOMS_TEMPLATE = MappingProxyType(
+    {"operationName": "GetRooms", "query": QUERY_GET_ROOMS}
+)
+_GET_PROPERTY_TEMPLATE = MappingProxyType(
+    {"operationName": "GetProperty", "query": QUERY_GET_PROPERTY}
+)
+_SET_TEMP_TEMPLATE = MappingProxyType(
+    {
+        "operationName": "SET_PROPERTY_ROOM_ADJUST_TEMPERATURE",
+        "query": MUT_SET_TEMP,
+    }
+)
+_SET_MODE_TEMPLATE = MappingProxyType(
+    {"operationName": "SetMode", "query": MUT_SET_MODE}
+)
+
 
 class TikoAuthenticationError(Exception):
     """Authentication error."""
@@ -36,8 +70,13 @@ class TikoAPI:
             session: The aiohttp client session
         """
         self.email = email
-        # Ensure password is properly encoded
-        self.password = urllib.parse.quote(password)
+        self.password = password
+        self.token: str | None = None
+        self.user_id: int | None = None
+        self.property_id: int | None = None
+        self._token_issued_at: float | None = None
+        self._rooms_body: bytes | None = None
+        self._property_body: bytes | None = None
         _LOGGER.debug(
             "Initializing TikoAPI with email: %s",
             email
@@ -58,6 +97,17 @@ class TikoAPI:
                 "Chrome/131.0.0.0 Safari/537.36"
             )
         }
+        # Read-only live view passed to every request, so callers cannot
+        # alter the headers; it reflects the token once authenticate() sets
+        # it. Keep-alive is handled by Home Assistant's shared connector.
+        self._headers_frozen = MappingProxyType(self.headers)
+
+    @property
+    def token_fresh(self) -> bool:
+        """Return whether the token is recent enough to be reused."""
+        if self._token_issued_at is None:
+            return False
+        return time.monotonic() - self._token_issued_at < TOKEN_REFRESH_AGE
 
     async def _make_request(
         self,
@@ -70,16 +120,16 @@ class TikoAPI:
             async with self.session.request(
                 method,
                 url,
-                headers=self.headers,
+                headers=self._headers_frozen,
                 **kwargs
             ) as response:
+                if response.status in (401, 403):
+                    raise TikoAuthenticationError(
+                        f"Authentication failed: HTTP {response.status}"
+                    )
                 response.raise_for_status()
 
-                # Pour la requête initiale GET, ne pas essayer de décoder JSON
-                if method == "GET" and url == self.base_url:
-                    return {}
-
-                # Pour toutes les autres requêtes, vérifier le type de contenu
+                # Vérifier le type de contenu
                 content_type = response.headers.get("Content-Type", "")
                 if "application/json" not in content_type:
                     _LOGGER.error(
@@ -91,7 +141,12 @@ class TikoAPI:
                         f"Unexpected content type: {content_type}"
                     )
 
-                result = await response.json()
+                try:
+                    result = _json_loads(await response.read())
+                except ValueError as err:
+                    raise aiohttp.ClientError(
+                        f"Invalid JSON response: {err}"
+                    ) from err
 
                 if "errors" in result:
                     error_msg = result["errors"][0]["message"]
@@ -99,7 +154,10 @@ class TikoAPI:
 
                     if "Limite de taux atteinte" in error_msg:
                         raise TikoRateLimitError(error_msg)
-                    if "Invalid credentials" in error_msg:
+                    if (
+                        "Invalid credentials" in error_msg
+                        or "Authentication failed" in error_msg
+                    ):
                         raise TikoAuthenticationError(error_msg)
                     raise aiohttp.ClientError(error_msg)
 
@@ -113,74 +171,9 @@ class TikoAPI:
         """Authenticate with the Tiko API."""
         _LOGGER.debug("Starting authentication process...")
 
-        # First get CSRF token
-        await self._make_request("GET", self.base_url)
-        _LOGGER.debug("Got initial CSRF token")
-
-        # Now login
-        query = gql("""
-            mutation LogIn(
-                $email: String!
-                $password: String!
-                $langCode: String
-                $retainSession: Boolean
-            ) {
-                logIn(
-                    input: {
-                        email: $email
-                        password: $password
-                        langCode: $langCode
-                        retainSession: $retainSession
-                    }
-                ) {
-                    settings {
-                        client {
-                            name
-                            __typename
-                        }
-                        support {
-                            serviceActive
-                            phone
-                            email
-                            __typename
-                        }
-                        __typename
-                    }
-                    user {
-                        id
-                        clientCustomerId
-                        agreements
-                        properties {
-                            id
-                            allInstalled
-                            __typename
-                        }
-                        inbox(modes: ["app"]) {
-                            actions {
-                                label
-                                type
-                                value
-                                __typename
-                            }
-                            id
-                            lockUser
-                            maxNumberOfSkip
-                            messageBody
-                            messageHeader
-                            __typename
-                        }
-                        __typename
-                    }
-                    token
-                    firstLogin
-                    __typename
-                }
-            }
-        """)
-
         variables = {
             "email": self.email,
-            "password": urllib.parse.unquote(self.password),
+            "password": self.password,
             "langCode": "fr",
             "retainSession": True
         }
@@ -190,7 +183,7 @@ class TikoAPI:
             self.url,
             json={
                 "operationName": "LogIn",
-                "query": query.loc.source.body,
+                "query": LOGIN_MUTATION,
                 "variables": variables
             }
         )
@@ -201,47 +194,36 @@ class TikoAPI:
 
         data = result["data"]["logIn"]
         self.token = data["token"]
+        self._token_issued_at = time.monotonic()
         self.user_id = data["user"]["id"]
         self.property_id = data["user"]["properties"][0]["id"]
 
+        # The poll queries only depend on the property, serialize them once
+        variables = {"propertyId": self.property_id}
+        self._rooms_body = json.dumps(
+            {**_GET_ROOMS_TEMPLATE, "variables": variables}
+        ).encode()
+        self._property_body = json.dumps(
+            {**_GET_PROPERTY_TEMPLATE, "variables": variables}
+        ).encode()
+
         # Update headers with token
         self.headers["Authorization"] = f"Token {self.token}"
-        _LOGGER.debug(
-            "Authentication successful. Token: %s..., User ID: %s, "
-            "Property ID: %s",
-            self.token[:10],
-            self.user_id,
-            self.property_id
-        )
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug(
+                "Authentication successful. Token: %s..., User ID: %s, "
+                "Property ID: %s",
+                self.token[:10],
+                self.user_id,
+                self.property_id
+            )
 
     async def get_rooms(self) -> Dict[str, Any]:
         """Get information about all rooms."""
         return await self._make_request(
             "POST",
             self.url,
-            json={
-                "operationName": "GetRooms",
-                "query": """
-                    query GetRooms($propertyId: Int!) {
-                        property(id: $propertyId) {
-                            rooms {
-                                id
-                                name
-                                currentTemperatureDegrees
-                                targetTemperatureDegrees
-                                humidity
-                                status {
-                                    heatingOperating
-                                    disconnected
-                                }
-                            }
-                        }
-                    }
-                """,
-                "variables": {
-                    "propertyId": self.property_id
-                }
-            }
+            data=self._rooms_body,
         )
 
     async def set_temperature(
@@ -254,31 +236,7 @@ class TikoAPI:
             "POST",
             self.url,
             json={
-                "operationName": "SET_PROPERTY_ROOM_ADJUST_TEMPERATURE",
-                "query": """
-                    mutation SET_PROPERTY_ROOM_ADJUST_TEMPERATURE(
-                        $propertyId: Int!
-                        $roomId: Int!
-                        $temperature: Float!
-                    ) {
-                        setRoomAdjustTemperature(
-                            input: {
-                                propertyId: $propertyId
-                                roomId: $roomId
-                                temperature: $temperature
-                            }
-                        ) {
-                            id
-                            adjustTemperature {
-                                active
-                                endDateTime
-                                temperature
-                                __typename
-                            }
-                            __typename
-                        }
-                    }
-                """,
+                **_SET_TEMP_TEMPLATE,
                 "variables": {
                     "propertyId": self.property_id,
                     "roomId": room_id,
@@ -293,23 +251,7 @@ class TikoAPI:
             "POST",
             self.url,
             json={
-                "operationName": "SetMode",
-                "query": """
-                    mutation SetMode(
-                        $propertyId: Int!
-                        $mode: String!
-                    ) {
-                        setPropertyMode(
-                            input: {
-                                propertyId: $propertyId
-                                mode: $mode
-                            }
-                        ) {
-                            id
-                            mode
-                        }
-                    }
-                """,
+                **_SET_MODE_TEMPLATE,
                 "variables": {
                     "propertyId": self.property_id,
                     "mode": mode
@@ -317,32 +259,10 @@ class TikoAPI:
             }
         )
 
-    async def get_devices(self) -> Dict[str, Any]:
-        """Get information about all devices."""
+    async def get_property(self) -> Dict[str, Any]:
+        """Get rooms and devices of the property in a single request."""
         return await self._make_request(
             "POST",
             self.url,
-            json={
-                "operationName": "GetDevices",
-                "query": """
-                    query GetDevices($propertyId: Int!) {
-                        property(id: $propertyId) {
-                            devices {
-                                id
-                                code
-                                type
-                                name
-                                mac
-                            }
-                            externalDevices {
-                                id
-                                name
-                            }
-                        }
-                    }
-                """,
-                "variables": {
-                    "propertyId": self.property_id
-                }
-            }
+            data=self._property_body,
         )